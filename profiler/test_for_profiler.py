@@ -0,0 +1,50 @@
+"""
+Profiling driver for the parser hot path.
+
+Runs the TestParse formula corpus through parse() many times so a single
+profiled pytest invocation captures a representative workload. The driver
+only runs when PROFILER_ITERATIONS is set, so ordinary suite runs that
+happen to collect this file skip it:
+
+    PROFILER_ITERATIONS=1000 python -m cProfile -o out.prof -m pytest profiler/ -q
+
+Review the profile with snakeviz out.prof.
+"""
+import os
+
+import pytest
+
+from src.parser import parse
+
+# Formula strings exercised by TestParse, covering every connective,
+# text operators, precedence, and nesting
+CORPUS = [
+    "p",
+    "¬p",
+    "not p",
+    "p and q",
+    "p or q",
+    "p -> q",
+    "p <-> q",
+    "(p ∧ q) → (¬r ∨ s)",
+    "(p and q) -> (not r or s)",
+    "p ∨ q ∧ r",
+    "¬(p ∧ q)",
+    "p → q → r ∧ s",
+    "¬p ↔ (q ∨ r) → ¬s",
+    "x1",
+    "p1 and q2",
+    "(x1 ∧ x2) → (y1 ∨ y2)",
+    "¬p1 ∨ q2",
+]
+
+
+@pytest.mark.skipif(
+    "PROFILER_ITERATIONS" not in os.environ,
+    reason="profiling driver; set PROFILER_ITERATIONS to run",
+)
+def test_parse_corpus_repeatedly():
+    iterations = int(os.environ["PROFILER_ITERATIONS"])
+    for _ in range(iterations):
+        for formula in CORPUS:
+            parse(formula)
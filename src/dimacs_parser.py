@@ -1,3 +1,4 @@
+from sys import intern
 from typing import List
 from src.logic_ast import CNFFormula, Clause, Literal
 
@@ -36,15 +37,24 @@ def parse_dimacs_string(dimacs_content: str) -> CNFFormula:
             raise ValueError(f"Clause must end with 0: {line}")
         
         literals: List[Literal] = []
+        seen_literals = set()
         for lit_str in literals_str[:-1]:
             lit_num = int(lit_str)
             if lit_num == 0:
                 break
-            
+
             if abs(lit_num) > num_variables:
                 raise ValueError(f"Variable {abs(lit_num)} exceeds declared variables {num_variables}")
-            
-            variable_name = f"x{abs(lit_num)}"
+
+            # Repeated literals add nothing to the clause; drop them so
+            # the solvers never rescan duplicates
+            if lit_num in seen_literals:
+                continue
+            seen_literals.add(lit_num)
+
+            # Interned so every occurrence shares one string object and
+            # dict lookups hit the pointer-equality fast path
+            variable_name = intern(f"x{abs(lit_num)}")
             is_negated = lit_num < 0
             literals.append(Literal(variable_name, negated=is_negated))
         
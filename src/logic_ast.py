@@ -1,21 +1,39 @@
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
+from weakref import WeakValueDictionary
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Formula(ABC):
     @abstractmethod
     def __str__(self) -> str:
         pass
 
-@dataclass
+# Interning pool for Variable: structurally identical variables share one
+# instance, cutting allocations in the preprocessing rewriters. Weak values
+# let unused names be collected instead of accumulating forever.
+_VARIABLE_POOL: "WeakValueDictionary[str, Variable]" = WeakValueDictionary()
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Variable(Formula):
     name: str
 
+    def __new__(cls, name: str) -> "Variable":
+        cached = _VARIABLE_POOL.get(name)
+        if cached is None:
+            cached = object.__new__(cls)
+            _VARIABLE_POOL[name] = cached
+        return cached
+
+    def __getnewargs__(self) -> tuple[str]:
+        # pickle and copy must pass name to __new__, which also routes
+        # reconstructed instances back through the interning pool
+        return (self.name,)
+
     def __str__(self) -> str:
         return self.name
     
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Not(Formula):
     operand: Formula
 
@@ -25,7 +43,7 @@ class Not(Formula):
         else:
             return f"¬({self.operand})" 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class And(Formula):
     left: Formula
     right: Formula
@@ -35,7 +53,7 @@ class And(Formula):
         right_str = str(self.right) if isinstance(self.right, Variable) else f"({self.right})"
         return f"{left_str} ∧ {right_str}"
     
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Or(Formula):
     left: Formula
     right: Formula
@@ -45,7 +63,7 @@ class Or(Formula):
         right_str = str(self.right) if isinstance(self.right, (Variable, Not)) else f"({self.right})"
         return f"{left_str} ∨ {right_str}" 
     
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Implies(Formula):
     left: Formula
     right: Formula
@@ -55,7 +73,7 @@ class Implies(Formula):
         right_str = str(self.right) if isinstance(self.right, Variable) else f"({self.right})"
         return f"{left_str} → {right_str}" 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Biconditional(Formula):
     left: Formula
     right: Formula
@@ -65,7 +83,7 @@ class Biconditional(Formula):
         right_str = str(self.right) if isinstance(self.right, Variable) else f"({self.right})"
         return f"{left_str} ↔ {right_str}" 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Literal(Formula):
     variable: str
     negated: bool = False
@@ -76,7 +94,7 @@ class Literal(Formula):
         else:
             return self.variable
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Clause(Formula):
     literals: list[Literal]
 
@@ -87,7 +105,7 @@ class Clause(Formula):
             return str(self.literals[0])
         return " ∨ ".join(str(lit) for lit in self.literals)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CNFFormula(Formula):
     clauses: list[Clause]
 
@@ -1,52 +1,45 @@
+import re
+
 from src.logic_ast import Formula, Variable, Not, And, Or, Implies, Biconditional
 
 
-def tokenize(formula: str) -> list[str]:
-    tokens: list[str] = []
-    i = 0
-
-    while i < len(formula):
-        char = formula[i]
-
-        if char.isspace():
-            i += 1
-            continue
-        elif char in "¬∧∨→↔()":
-            tokens.append(char)
-            i += 1
-        elif char.isalpha():
-            token = ""
-            while i < len(formula) and (formula[i].isalpha() or formula[i].isdigit()):
-                token += formula[i]
-                i += 1
-            tokens.append(token)
-        elif char == '-' and i + 1 < len(formula) and formula[i + 1] == '>':
-            tokens.append('->')
-            i += 2
-        elif char == '<' and i + 2 < len(formula) and formula[i + 1:i + 3] == '->':
-            tokens.append('<->')
-            i += 3
-        else:
-            raise ValueError(f"Invalid character '{char}' in formula")
+# Compiled token scanner: one C-level regex pass instead of a Python
+# loop over individual characters
+_SCANNER = re.Scanner([
+    (r"[¬∧∨→↔()]", lambda scanner, token: token),
+    (r"<->", lambda scanner, token: token),
+    (r"->", lambda scanner, token: token),
+    # Unicode-aware identifier: a letter followed by letters or digits,
+    # mirroring the str.isalpha()/isdigit() checks of the old loop
+    (r"[^\W\d_][^\W_]*", lambda scanner, token: token),
+    (r"\s+", None),
+], flags=re.UNICODE)  # Scanner does not apply the str-pattern Unicode default itself
 
+
+def tokenize(formula: str) -> list[str]:
+    tokens, remainder = _SCANNER.scan(formula)
+    if remainder:
+        raise ValueError(f"Invalid character '{remainder[0]}' in formula")
     return tokens
 
 
 class Parser:
     def __init__(self, tokens: list[str]):
         self.tokens = tokens
-        self.position = 0
-    
+        # Iterator plus a one-token lookahead buffer: peek/consume touch a
+        # single attribute instead of indexing the list through a position
+        # counter on every call
+        self._iterator = iter(tokens)
+        self._lookahead = next(self._iterator, None)
+
     def peek(self) -> str | None:
-        if self.position < len(self.tokens):
-            return self.tokens[self.position]
-        return None
-    
+        return self._lookahead
+
     def consume(self) -> str:
-        if self.position >= len(self.tokens):
+        token = self._lookahead
+        if token is None:
             raise ValueError("Unexpected end of formula")
-        token = self.tokens[self.position]
-        self.position += 1
+        self._lookahead = next(self._iterator, None)
         return token
     
     def parse_biconditional(self) -> Formula:
@@ -1,7 +1,11 @@
-from typing import Type, Callable
 from src.logic_ast import Formula, Variable, Not, And, Or, Implies, Biconditional, Literal, Clause, CNFFormula
 
 
+# Stack marker used by push_negations_inward: flags the traversal result
+# beneath it as changed after a Not node has been folded into the flag
+_FORCE_CHANGED = object()
+
+
 def to_nnf(formula: Formula) -> Formula:
     """
     Convert a logical formula to Negation Normal Form (NNF).
@@ -16,13 +20,76 @@ def to_nnf(formula: Formula) -> Formula:
         ValueError: If the transformation fails
     """
     try:
-        without_implications = eliminate_implications(formula)
-        nnf_formula = push_negations_inward(without_implications)
-        return nnf_formula
+        return _to_nnf(formula)
     except Exception as e:
         raise ValueError(f"Failed to convert to NNF: {e}") from e
 
 
+def _to_nnf(formula: Formula) -> Formula:
+    """
+    Fused NNF conversion: eliminate implications and push negations inward
+    in a single explicit-stack traversal.
+
+    Produces the same tree as push_negations_inward(eliminate_implications(f))
+    without allocating the intermediate implication-free formula. An Implies
+    is treated as an Or with a pre-negated left operand; a Biconditional
+    expands to its two-clause form with each operand visited once per
+    polarity.
+    """
+    # Each entry is (node, negated, visited), as in push_negations_inward
+    stack: list[tuple[Formula, bool, bool]] = [(formula, False, False)]
+    results: list[Formula] = []
+
+    while stack:
+        node, negated, visited = stack.pop()
+        node_type = type(node)
+
+        if visited:
+            if node_type is Biconditional:
+                # A ↔ B becomes (¬A ∨ B) ∧ (¬B ∨ A); under negation the
+                # connectives dualize
+                r4 = results.pop()
+                r3 = results.pop()
+                r2 = results.pop()
+                r1 = results.pop()
+                if negated:
+                    results.append(Or(And(r1, r2), And(r3, r4)))
+                else:
+                    results.append(And(Or(r1, r2), Or(r3, r4)))
+            else:
+                right = results.pop()
+                left = results.pop()
+                # And stays And unless negated (De Morgan); Implies and Or
+                # both rebuild as Or unless negated
+                if (node_type is And) != negated:
+                    results.append(And(left, right))
+                else:
+                    results.append(Or(left, right))
+        elif node_type is Variable:
+            results.append(Not(node) if negated else node)
+        elif node_type is Not:
+            stack.append((node.operand, not negated, False))
+        elif node_type in (And, Or):
+            stack.append((node, negated, True))
+            stack.append((node.right, negated, False))
+            stack.append((node.left, negated, False))
+        elif node_type is Implies:
+            # A → B is ¬A ∨ B: same rebuild as Or, left operand negated
+            stack.append((node, negated, True))
+            stack.append((node.right, negated, False))
+            stack.append((node.left, not negated, False))
+        elif node_type is Biconditional:
+            stack.append((node, negated, True))
+            stack.append((node.left, negated, False))
+            stack.append((node.right, not negated, False))
+            stack.append((node.right, negated, False))
+            stack.append((node.left, not negated, False))
+        else:
+            raise ValueError(f"Unknown formula type: {node_type.__name__}")
+
+    return results[0]
+
+
 def eliminate_implications(formula: Formula) -> Formula:
     """
     Eliminate implications and biconditionals from a logical formula.
@@ -30,18 +97,51 @@ def eliminate_implications(formula: Formula) -> Formula:
     Transforms:
     - A → B becomes ¬A ∨ B
     - A ↔ B becomes (¬A ∨ B) ∧ (¬B ∨ A)
+
+    Uses an explicit stack with post-order rebuilding instead of recursion,
+    so deeply nested formulas cannot overflow the call stack. Subtrees that
+    contain no implications come back unchanged and are returned by
+    reference instead of being rebuilt.
     """
+    # Each entry is (node, visited): on the first visit children are pushed,
+    # on the second visit their (result, changed) pairs are popped and the
+    # node is rebuilt only if a child actually changed
+    stack: list[tuple[Formula, bool]] = [(formula, False)]
+    results: list[tuple[Formula, bool]] = []
 
-    transformation_map = {
-        Variable: _eliminate_implications_variable,
-        Not: _eliminate_implications_not,
-        And: _eliminate_implications_and,
-        Or: _eliminate_implications_or,
-        Implies: _eliminate_implications_implies,
-        Biconditional: _eliminate_implications_biconditional,
-    }
+    while stack:
+        node, visited = stack.pop()
+        node_type = type(node)
+
+        if not visited:
+            if node_type is Variable:
+                results.append((node, False))
+            elif node_type is Not:
+                stack.append((node, True))
+                stack.append((node.operand, False))
+            elif node_type in (And, Or, Implies, Biconditional):
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+            else:
+                raise ValueError(f"Unknown formula type: {node_type.__name__}")
+        elif node_type is Not:
+            operand, changed = results.pop()
+            results.append((Not(operand), True) if changed else (node, False))
+        else:
+            right, right_changed = results.pop()
+            left, left_changed = results.pop()
+            if node_type is Implies:
+                results.append((Or(Not(left), right), True))
+            elif node_type is Biconditional:
+                results.append((And(Or(Not(left), right), Or(Not(right), left)), True))
+            elif left_changed or right_changed:
+                rebuilt = And(left, right) if node_type is And else Or(left, right)
+                results.append((rebuilt, True))
+            else:
+                results.append((node, False))
 
-    return _apply_transformation(formula, transformation_map, "eliminate_implications")
+    return results[0][0]
 
 
 def push_negations_inward(formula: Formula) -> Formula:
@@ -52,16 +152,59 @@ def push_negations_inward(formula: Formula) -> Formula:
     - ¬¬A becomes A
     - ¬(A ∧ B) becomes ¬A ∨ ¬B
     - ¬(A ∨ B) becomes ¬A ∧ ¬B
+
+    Uses an explicit stack with post-order rebuilding instead of recursion.
+    The negation context travels with each node: a Not flips the flag of its
+    operand, so double negations cancel and De Morgan's laws fall out of the
+    flag when And/Or nodes are rebuilt. Subtrees already in NNF come back
+    unchanged and are returned by reference instead of being rebuilt.
     """
+    # Each entry is (node, negated, visited) or the _FORCE_CHANGED marker,
+    # which flags the result below it as changed after a Not was folded away
+    stack = [(formula, False, False)]
+    results: list[tuple[Formula, bool]] = []
 
-    transformation_map = {
-        Variable: _push_negations_variable,
-        Not: _push_negations_not,
-        And: _push_negations_and,
-        Or: _push_negations_or,
-    }
+    while stack:
+        entry = stack.pop()
+        if entry is _FORCE_CHANGED:
+            node, _ = results.pop()
+            results.append((node, True))
+            continue
+        node, negated, visited = entry
+        node_type = type(node)
+
+        if visited:
+            right, right_changed = results.pop()
+            left, left_changed = results.pop()
+            if negated:
+                # De Morgan: a negated And rebuilds as Or and vice versa
+                rebuilt = Or(left, right) if node_type is And else And(left, right)
+                results.append((rebuilt, True))
+            elif left_changed or right_changed:
+                rebuilt = And(left, right) if node_type is And else Or(left, right)
+                results.append((rebuilt, True))
+            else:
+                results.append((node, False))
+        elif node_type is Variable:
+            results.append((Not(node), True) if negated else (node, False))
+        elif node_type is Not:
+            if not negated and type(node.operand) is Variable:
+                # ¬p is already in NNF: keep the original node
+                results.append((node, False))
+            else:
+                # Folding this Not into the flag always changes the subtree
+                stack.append(_FORCE_CHANGED)
+                stack.append((node.operand, not negated, False))
+        elif node_type in (And, Or):
+            stack.append((node, negated, True))
+            stack.append((node.right, negated, False))
+            stack.append((node.left, negated, False))
+        elif negated:
+            raise ValueError(f"Unexpected formula under negation: {node_type.__name__}")
+        else:
+            raise ValueError(f"Unknown formula type: {node_type.__name__}")
 
-    return _apply_transformation(formula, transformation_map, "push_negations_inward")
+    return results[0][0]
 
 
 def distribute_or_over_and(formula: Formula) -> Formula:
@@ -71,16 +214,80 @@ def distribute_or_over_and(formula: Formula) -> Formula:
     Transforms:
     - A ∨ (B ∧ C) becomes (A ∨ B) ∧ (A ∨ C)
     - (A ∧ B) ∨ C becomes (A ∨ C) ∧ (B ∨ C)
+
+    Uses an explicit stack with post-order rebuilding instead of recursion;
+    the distributive step itself is also iterative, so the exponential
+    blowup CNF conversion can produce never exhausts the call stack.
+    Subtrees that need no distribution come back unchanged and are returned
+    by reference instead of being rebuilt.
+    """
+    # Each entry is (node, visited), as in eliminate_implications
+    stack: list[tuple[Formula, bool]] = [(formula, False)]
+    results: list[tuple[Formula, bool]] = []
+
+    while stack:
+        node, visited = stack.pop()
+        node_type = type(node)
+
+        if visited:
+            if node_type is Not:
+                operand, changed = results.pop()
+                results.append((Not(operand), True) if changed else (node, False))
+            else:
+                right, right_changed = results.pop()
+                left, left_changed = results.pop()
+                if node_type is Or and (type(left) is And or type(right) is And):
+                    results.append((_distribute_pair(left, right), True))
+                elif left_changed or right_changed:
+                    rebuilt = And(left, right) if node_type is And else Or(left, right)
+                    results.append((rebuilt, True))
+                else:
+                    results.append((node, False))
+        elif node_type is Variable:
+            results.append((node, False))
+        elif node_type is Not:
+            stack.append((node, True))
+            stack.append((node.operand, False))
+        elif node_type in (And, Or):
+            stack.append((node, True))
+            stack.append((node.right, False))
+            stack.append((node.left, False))
+        else:
+            raise ValueError(f"Unknown formula type: {node_type.__name__}")
+
+    return results[0][0]
+
+
+def _distribute_pair(left: Formula, right: Formula) -> Formula:
     """
+    Combine two already-distributed operands into a distributed disjunction.
 
-    transformation_map = {
-        Variable: _distribute_variable,
-        Not: _distribute_not,
-        And: _distribute_and,
-        Or: _distribute_or,
-    }
+    Applies A ∨ (B ∧ C) = (A ∨ B) ∧ (A ∨ C) (and its mirror) repeatedly
+    with an explicit stack of operand pairs until no And remains directly
+    under an Or.
+    """
+    stack: list[tuple[tuple[Formula, Formula], bool]] = [((left, right), False)]
+    results: list[Formula] = []
 
-    return _apply_transformation(formula, transformation_map, "distribute_or_over_and")
+    while stack:
+        (left, right), visited = stack.pop()
+
+        if visited:
+            second = results.pop()
+            first = results.pop()
+            results.append(And(first, second))
+        elif isinstance(right, And):
+            stack.append(((left, right), True))
+            stack.append(((left, right.right), False))
+            stack.append(((left, right.left), False))
+        elif isinstance(left, And):
+            stack.append(((left, right), True))
+            stack.append(((left.right, right), False))
+            stack.append(((left.left, right), False))
+        else:
+            results.append(Or(left, right))
+
+    return results[0]
 
 
 def to_cnf(formula: Formula) -> CNFFormula:
@@ -98,12 +305,48 @@ def to_cnf(formula: Formula) -> CNFFormula:
     """
     try:
         nnf_formula = to_nnf(formula)
-        cnf_formula = distribute_or_over_and(nnf_formula)
-        return formula_to_cnf_format(cnf_formula)
+        clauses = [Clause(literals) for literals in _cnf_clauses(nnf_formula)]
+        return CNFFormula(clauses)
     except Exception as e:
         raise ValueError(f"Failed to convert to CNF: {e}") from e
 
 
+def _cnf_clauses(formula: Formula) -> list[list[Literal]]:
+    """
+    Build the clause lists of an NNF formula bottom-up in one traversal.
+
+    And concatenates the operand clause lists; Or takes their cross
+    product. This produces the same clauses in the same order as
+    distributing Or over And and flattening the result, without ever
+    materializing the intermediate Or(And(...)) trees that distribution
+    allocates only to rewrite again.
+    """
+    stack: list[tuple[Formula, bool]] = [(formula, False)]
+    results: list[list[list[Literal]]] = []
+
+    while stack:
+        node, visited = stack.pop()
+        node_type = type(node)
+
+        if visited:
+            right = results.pop()
+            left = results.pop()
+            if node_type is And:
+                results.append(left + right)
+            else:  # Or: right-major cross product matches distribution order
+                results.append([x + y for y in right for x in left])
+        elif _is_literal(node):
+            results.append([[formula_to_literal(node)]])
+        elif node_type in (And, Or):
+            stack.append((node, True))
+            stack.append((node.right, False))
+            stack.append((node.left, False))
+        else:
+            raise ValueError(f"Expected CNF formula, got {node_type.__name__}")
+
+    return results[0]
+
+
 def formula_to_cnf_format(formula: Formula) -> CNFFormula:
     """Convert a formula in CNF structure to CNFFormula object."""
     if _is_literal(formula):
@@ -162,172 +405,11 @@ def formula_to_literal(formula: Formula) -> Literal:
 
 # Private helper functions for transformation patterns
 
-def _validate_formula_input(formula: Formula) -> None:
-    """Validate that input is a Formula instance."""
-    if not isinstance(formula, Formula):
-        raise ValueError(f"Expected Formula instance, got {type(formula).__name__}")
-
-
-def _apply_transformation(formula: Formula, transformation_map: dict[Type, callable], operation_name: str) -> Formula:
-    """Apply transformation using the provided mapping."""
-    formula_type = type(formula)
-    if formula_type not in transformation_map:
-        raise ValueError(f"Unknown formula type: {formula_type.__name__}")
-
-    return transformation_map[formula_type](formula)
-
-
 def _is_literal(formula: Formula) -> bool:
     """Check if formula is a literal (variable or negated variable)."""
     return isinstance(formula, Variable) or (isinstance(formula, Not) and isinstance(formula.operand, Variable))
 
 
-def _transform_binary_operator(formula: Formula,
-                              left_transform_func: Callable[[Formula], Formula],
-                              right_transform_func: Callable[[Formula], Formula],
-                              operator_class: Type[Formula]) -> Formula:
-    """
-    Generic helper to transform binary operators (And, Or) by applying
-    transformation functions to left and right operands.
-
-    Args:
-        formula: Binary formula with left and right attributes
-        left_transform_func: Function to apply to left operand
-        right_transform_func: Function to apply to right operand
-        operator_class: Class constructor for the result (And, Or, etc.)
-
-    Returns:
-        New formula instance with transformed operands
-    """
-    return operator_class(
-        left_transform_func(formula.left),
-        right_transform_func(formula.right)
-    )
-
-
-# Transformation functions for eliminate_implications
-
-def _eliminate_implications_variable(formula: Variable) -> Formula:
-    return formula
-
-
-def _eliminate_implications_not(formula: Not) -> Formula:
-    return Not(eliminate_implications(formula.operand))
-
-
-def _eliminate_implications_and(formula: And) -> Formula:
-    return _transform_binary_operator(formula, eliminate_implications, eliminate_implications, And)
-
-
-def _eliminate_implications_or(formula: Or) -> Formula:
-    return _transform_binary_operator(formula, eliminate_implications, eliminate_implications, Or)
-
-
-def _eliminate_implications_implies(formula: Implies) -> Formula:
-    return Or(
-        Not(eliminate_implications(formula.left)),
-        eliminate_implications(formula.right)
-    )
-
-
-def _eliminate_implications_biconditional(formula: Biconditional) -> Formula:
-    left = eliminate_implications(formula.left)
-    right = eliminate_implications(formula.right)
-    return And(
-        Or(Not(left), right),
-        Or(Not(right), left)
-    )
-
-
-# Transformation functions for push_negations_inward
-
-def _push_negations_variable(formula: Variable) -> Formula:
-    return formula
-
-
-def _push_negations_not(formula: Not) -> Formula:
-    operand = formula.operand
-
-    if isinstance(operand, Variable):
-        return formula
-    elif isinstance(operand, Not):
-        # Double negation elimination
-        return push_negations_inward(operand.operand)
-    elif isinstance(operand, And):
-        return _apply_de_morgan_to_and(operand)
-    elif isinstance(operand, Or):
-        return _apply_de_morgan_to_or(operand)
-    else:
-        raise ValueError(f"Unexpected formula under negation: {type(operand).__name__}")
-
-
-def _apply_de_morgan_to_and(operand: And) -> Formula:
-    """Apply De Morgan's law to AND: ¬(A ∧ B) = ¬A ∨ ¬B"""
-    return Or(
-        push_negations_inward(Not(operand.left)),
-        push_negations_inward(Not(operand.right))
-    )
-
-
-def _apply_de_morgan_to_or(operand: Or) -> Formula:
-    """Apply De Morgan's law to OR: ¬(A ∨ B) = ¬A ∧ ¬B"""
-    return And(
-        push_negations_inward(Not(operand.left)),
-        push_negations_inward(Not(operand.right))
-    )
-
-
-def _push_negations_and(formula: And) -> Formula:
-    return _transform_binary_operator(formula, push_negations_inward, push_negations_inward, And)
-
-
-def _push_negations_or(formula: Or) -> Formula:
-    return _transform_binary_operator(formula, push_negations_inward, push_negations_inward, Or)
-
-
-# Transformation functions for distribute_or_over_and
-
-def _distribute_variable(formula: Variable) -> Formula:
-    return formula
-
-
-def _distribute_not(formula: Not) -> Formula:
-    return Not(distribute_or_over_and(formula.operand))
-
-
-def _distribute_and(formula: And) -> Formula:
-    return _transform_binary_operator(formula, distribute_or_over_and, distribute_or_over_and, And)
-
-
-def _distribute_or(formula: Or) -> Formula:
-    left = distribute_or_over_and(formula.left)
-    right = distribute_or_over_and(formula.right)
-
-    # Apply distributive law: A ∨ (B ∧ C) = (A ∨ B) ∧ (A ∨ C)
-    if isinstance(right, And):
-        return _distribute_left_over_and(left, right)
-    elif isinstance(left, And):
-        return _distribute_right_over_and(left, right)
-    else:
-        return Or(left, right)
-
-
-def _distribute_left_over_and(left_operand: Formula, right_and: And) -> Formula:
-    """Distribute left operand over AND: A ∨ (B ∧ C) = (A ∨ B) ∧ (A ∨ C)"""
-    return And(
-        distribute_or_over_and(Or(left_operand, right_and.left)),
-        distribute_or_over_and(Or(left_operand, right_and.right))
-    )
-
-
-def _distribute_right_over_and(left_and: And, right_operand: Formula) -> Formula:
-    """Distribute right operand over AND: (A ∧ B) ∨ C = (A ∨ C) ∧ (B ∨ C)"""
-    return And(
-        distribute_or_over_and(Or(left_and.left, right_operand)),
-        distribute_or_over_and(Or(left_and.right, right_operand))
-    )
-
-
 def to_cnf_tseytin(formula: Formula) -> CNFFormula:
     """
     Convert a formula to CNF using Tseytin transformation.
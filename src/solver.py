@@ -1,5 +1,9 @@
+import heapq
+import multiprocessing
+import random
+from collections import deque
 from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 
 from src.logic_ast import CNFFormula, Clause, Literal
@@ -10,7 +14,7 @@ class DecisionResult(Enum):
     UNSAT = "UNSAT"
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment:
     variable: str
     value: bool
@@ -18,14 +22,67 @@ class Assignment:
     reason: Optional[Clause] = None
 
 
-@dataclass
 class ImplicationNode:
-    variable: str
-    value: bool
-    decision_level: int
-    reason: Optional[Clause] = None
-    antecedents: List[str] = field(default_factory=lambda: [])
-    
+    """Node in the implication graph.
+
+    Antecedents are materialized lazily from the reason clause on first
+    access, so propagation never pays for a list that conflict analysis
+    may not read.
+    """
+
+    __slots__ = ("variable", "value", "decision_level", "reason",
+                 "_antecedents", "_graph")
+
+    def __init__(self, variable: str, value: bool, decision_level: int,
+                 reason: Optional[Clause] = None, antecedents=None, graph=None):
+        self.variable = variable
+        self.value = value
+        self.decision_level = decision_level
+        self.reason = reason
+        self._antecedents = antecedents
+        self._graph = graph
+
+    @property
+    def antecedents(self):
+        if self._antecedents is None:
+            if self.reason is None or self._graph is None:
+                self._antecedents = []
+            else:
+                self._antecedents = [
+                    self._graph[literal.variable]
+                    for literal in self.reason.literals
+                    if (literal.variable != self.variable and
+                        literal.variable in self._graph)
+                ]
+        return self._antecedents
+
+
+def _evaluate_clause_literals(clause: Clause, assignment: Dict[str, bool]) -> Optional[bool]:
+    """Evaluate a clause against an assignment dict.
+
+    Shared by both solvers so the hot tristate logic lives in one place.
+
+    Args:
+        clause: Clause to evaluate
+        assignment: Current variable assignment
+
+    Returns:
+        True if clause satisfied, False if unsatisfied, None if undetermined
+    """
+    unassigned_count = 0
+    lookup = assignment.get
+
+    for literal in clause.literals:
+        # Single dict probe per literal; None marks unassigned
+        variable_value = lookup(literal.variable)
+        if variable_value is None:
+            unassigned_count += 1
+        elif variable_value != literal.negated:
+            return True
+
+    # No literal satisfied the clause
+    return False if unassigned_count == 0 else None
+
 
 class DPLLSolver:
     """DPLL (Davis-Putnam-Logemann-Loveland) SAT solver.
@@ -42,7 +99,62 @@ class DPLLSolver:
         """
         self.cnf = cnf_formula
         self.assignment: Dict[str, bool] = {}
-    
+        self.variables = self._get_all_variables()
+        self._positive_occurrences, self._negative_occurrences = self._build_occurrence_lists()
+        self._variable_bits = {variable: bit for bit, variable in enumerate(self.variables)}
+        self._positive_masks, self._negative_masks = self._build_clause_masks()
+        # Subtrees with at most this many free variables are decided by
+        # bit-parallel enumeration instead of branching
+        self._tail_enumeration_limit = 8
+
+    def _build_clause_masks(self) -> tuple[List[int], List[int]]:
+        """Precompute per-clause literal bitmasks for bitset evaluation.
+
+        Each clause is summarized as two integer bitmaps over variable
+        bits: one for positive literals, one for negative literals. The
+        masks are kept in two parallel flat lists so the satisfaction
+        sweep iterates plain int sequences rather than an object graph.
+
+        Returns:
+            Parallel lists of (positive masks, negative masks), one entry per clause
+        """
+        positive_masks: List[int] = []
+        negative_masks: List[int] = []
+
+        for clause in self.cnf.clauses:
+            positive_mask = 0
+            negative_mask = 0
+            for literal in clause.literals:
+                bit = 1 << self._variable_bits[literal.variable]
+                if literal.negated:
+                    negative_mask |= bit
+                else:
+                    positive_mask |= bit
+            positive_masks.append(positive_mask)
+            negative_masks.append(negative_mask)
+
+        return positive_masks, negative_masks
+
+    def _build_occurrence_lists(self) -> tuple[Dict[str, List[Clause]], Dict[str, List[Clause]]]:
+        """Build per-variable clause occurrence lists for each polarity.
+
+        Computed once at construction so pure-literal checks can visit
+        only the clauses containing a variable instead of rescanning the
+        whole formula.
+
+        Returns:
+            Tuple of (positive occurrences, negative occurrences) maps
+        """
+        positive: Dict[str, List[Clause]] = {}
+        negative: Dict[str, List[Clause]] = {}
+
+        for clause in self.cnf.clauses:
+            for literal in clause.literals:
+                occurrences = negative if literal.negated else positive
+                occurrences.setdefault(literal.variable, []).append(clause)
+
+        return positive, negative
+
     def solve(self) -> DecisionResult:
         """Solve the CNF formula using DPLL algorithm.
 
@@ -50,51 +162,131 @@ class DPLLSolver:
             DecisionResult.SAT if formula is satisfiable, DecisionResult.UNSAT otherwise
         """
         return self._dpll({})
-    
+
     def _dpll(self, assignment: Dict[str, bool]) -> DecisionResult:
-        """Core DPLL recursive algorithm.
+        """Core DPLL algorithm using an explicit search stack.
 
-        Implements the classic DPLL procedure:
+        Implements the classic DPLL procedure iteratively:
         1. Unit propagation to force unit clauses
         2. Pure literal elimination for optimization
         3. Check satisfiability of current assignment
-        4. Choose variable and recursively try both values
+        4. Choose variable and push both branches onto the stack
+
+        The explicit stack replaces Python recursion, avoiding per-call
+        frame overhead and RecursionError on deep search trees. A single
+        shared assignment dict is used throughout: every assignment is
+        recorded on a trail, and backtracking deletes the trail suffix
+        instead of copying the whole dict at each node.
+
+        The packed truth/assigned bitmaps consumed by the clause-mask
+        checks are maintained incrementally from the trail (set a bit
+        per new assignment, clear it on undo) rather than rebuilt from
+        the dict on every loop iteration.
 
         Args:
-            assignment: Current partial variable assignment
+            assignment: Initial partial variable assignment
 
         Returns:
             DecisionResult.SAT if satisfiable with this assignment, DecisionResult.UNSAT otherwise
         """
-        current_assignment = assignment.copy()
-
-        # Apply unit propagation - return UNSAT if conflict detected
-        if not self._unit_propagation(current_assignment):
-            return DecisionResult.UNSAT
-
-        # Apply pure literal elimination optimization
-        self._pure_literal_elimination(current_assignment)
-
-        # Check if all clauses are satisfied
-        if self._all_clauses_satisfied(current_assignment):
-            self.assignment = current_assignment
-            return DecisionResult.SAT
+        assignment = assignment.copy()
+        trail: List[str] = []
+        # Each frame: (variable, value tried, trail length before the decision)
+        decisions: List[tuple[str, bool, int]] = []
+
+        variable_bits = self._variable_bits
+        truth_bitmap = 0
+        assigned_bitmap = 0
+        for variable, value in assignment.items():
+            bit = 1 << variable_bits[variable]
+            assigned_bitmap |= bit
+            if value:
+                truth_bitmap |= bit
+        # Trail entries already folded into the bitmaps
+        folded = 0
+
+        # Variables assigned since the last propagation fixpoint; None
+        # forces the one full formula scan of the first round
+        seeds: Optional[List[str]] = None
 
-        # Choose next variable for branching
-        branch_variable = self._choose_variable(current_assignment)
-
-        # Try positive assignment first
-        positive_assignment = current_assignment.copy()
-        positive_assignment[branch_variable] = True
-        if self._dpll(positive_assignment) == DecisionResult.SAT:
-            return DecisionResult.SAT
+        while True:
+            no_conflict = self._unit_propagation(assignment, trail, seeds)
+
+            # Fold assignments made since the last fold into the bitmaps
+            while folded < len(trail):
+                bit = 1 << variable_bits[trail[folded]]
+                assigned_bitmap |= bit
+                if assignment[trail[folded]]:
+                    truth_bitmap |= bit
+                folded += 1
+
+            if no_conflict:
+                # Apply pure literal elimination optimization
+                self._pure_literal_elimination(
+                    assignment, trail, bitmaps=(truth_bitmap, assigned_bitmap))
+                while folded < len(trail):
+                    bit = 1 << variable_bits[trail[folded]]
+                    assigned_bitmap |= bit
+                    if assignment[trail[folded]]:
+                        truth_bitmap |= bit
+                    folded += 1
+
+                # Check if all clauses are satisfied
+                if self._all_clauses_satisfied(
+                        assignment, bitmaps=(truth_bitmap, assigned_bitmap)):
+                    self.assignment = assignment
+                    return DecisionResult.SAT
+
+                # With few free variables left, decide the whole subtree
+                # in one bit-parallel pass instead of branching further
+                if len(self.variables) - len(assignment) <= self._tail_enumeration_limit:
+                    completion = self._enumerate_tail(
+                        assignment, truth_bitmap, assigned_bitmap)
+                    if completion is not None:
+                        assignment.update(completion)
+                        self.assignment = assignment
+                        return DecisionResult.SAT
+                    # No completion satisfies the formula: backtrack
+                else:
+                    # Decide: try the positive branch first
+                    branch_variable = self._choose_variable(assignment)
+                    decisions.append((branch_variable, True, len(trail)))
+                    assignment[branch_variable] = True
+                    trail.append(branch_variable)
+                    bit = 1 << variable_bits[branch_variable]
+                    assigned_bitmap |= bit
+                    truth_bitmap |= bit
+                    folded += 1
+                    # Only clauses touched by the new decision can react;
+                    # pure-literal assignments never falsify anything
+                    seeds = [branch_variable]
+                    continue
 
-        # Try negative assignment
-        negative_assignment = current_assignment.copy()
-        negative_assignment[branch_variable] = False
-        return self._dpll(negative_assignment)
+            # Conflict: undo decisions until one still has an untried branch
+            while decisions:
+                variable, tried_value, trail_mark = decisions.pop()
+                while len(trail) > trail_mark:
+                    undone = trail.pop()
+                    del assignment[undone]
+                    bit = 1 << variable_bits[undone]
+                    assigned_bitmap &= ~bit
+                    truth_bitmap &= ~bit
+                folded = len(trail)
+
+                if tried_value is True:
+                    decisions.append((variable, False, trail_mark))
+                    assignment[variable] = False
+                    trail.append(variable)
+                    assigned_bitmap |= 1 << variable_bits[variable]
+                    folded += 1
+                    seeds = [variable]
+                    break
+            else:
+                return DecisionResult.UNSAT
     
-    def _unit_propagation(self, assignment: Dict[str, bool]) -> bool:
+    def _unit_propagation(self, assignment: Dict[str, bool],
+                          trail: Optional[List[str]] = None,
+                          seeds: Optional[List[str]] = None) -> bool:
         """Apply unit propagation to assignment.
 
         For each unit clause (only one unassigned literal), forces that literal's value.
@@ -102,87 +294,259 @@ class DPLLSolver:
 
         Args:
             assignment: Variable assignment to modify
+            trail: Optional list recording newly assigned variables for undo
+            seeds: Optional just-assigned variables; when given, only
+                clauses touched by them are examined instead of the whole
+                formula, which is valid when the assignment was already at
+                a propagation fixpoint before the seeds were set
 
         Returns:
             False if conflict detected, True otherwise
         """
-        while True:
-            propagated_any = False
+        pending: deque = deque()
 
-            for clause in self.cnf.clauses:
-                clause_state = self._evaluate_clause(clause, assignment)
+        # Hoist hot lookups out of the propagation loops
+        propagate_clause = self._propagate_clause
+        negative_occurrences = self._negative_occurrences.get
+        positive_occurrences = self._positive_occurrences.get
 
-                # Check for conflict (unsatisfied clause)
-                if clause_state is False:
+        if seeds is None:
+            # Initial pass over the whole formula to catch pre-existing
+            # unit clauses and conflicts
+            for clause in self.cnf.clauses:
+                if not propagate_clause(clause, assignment, pending, trail):
+                    return False
+        else:
+            pending.extend(seeds)
+
+        # After that, only clauses containing a just-falsified literal can
+        # become unit or conflicting, so follow the occurrence lists instead
+        # of rescanning the whole formula each round
+        while pending:
+            variable = pending.popleft()
+            if assignment[variable]:
+                affected_clauses = negative_occurrences(variable, [])
+            else:
+                affected_clauses = positive_occurrences(variable, [])
+
+            for clause in affected_clauses:
+                if not propagate_clause(clause, assignment, pending, trail):
                     return False
 
-                # Skip satisfied clauses
-                if clause_state is True:
-                    continue
+        return True
 
-                # Find unassigned literals in undetermined clause
-                unassigned_literals = [
-                    literal for literal in clause.literals
-                    if literal.variable not in assignment
-                ]
+    def _propagate_clause(self, clause: Clause, assignment: Dict[str, bool],
+                          pending: deque, trail: Optional[List[str]] = None) -> bool:
+        """Check a single clause for conflict or unit implication.
 
-                # Process unit clause (exactly one unassigned literal)
-                if len(unassigned_literals) == 1:
-                    unit_literal = unassigned_literals[0]
-                    assignment[unit_literal.variable] = not unit_literal.negated
-                    propagated_any = True
+        If the clause is unit, assigns its last literal and queues the
+        variable for further propagation.
 
-            if not propagated_any:
-                break
+        Args:
+            clause: Clause to examine
+            assignment: Variable assignment to modify
+            pending: Queue of newly assigned variables
+            trail: Optional list recording newly assigned variables for undo
+
+        Returns:
+            False if the clause is falsified, True otherwise
+        """
+        # Single pass: classify the clause and find the unit literal at
+        # the same time instead of evaluating and then rescanning
+        lookup = assignment.get
+        unassigned_count = 0
+        unit_literal = None
+
+        for literal in clause.literals:
+            variable_value = lookup(literal.variable)
+            if variable_value is None:
+                unassigned_count += 1
+                if unassigned_count > 1:
+                    return True
+                unit_literal = literal
+            elif variable_value != literal.negated:
+                # Satisfied clause: nothing to propagate
+                return True
+
+        # Conflict (all literals false)
+        if unassigned_count == 0:
+            return False
+
+        # Unit clause: force the remaining literal
+        assignment[unit_literal.variable] = not unit_literal.negated
+        pending.append(unit_literal.variable)
+        if trail is not None:
+            trail.append(unit_literal.variable)
 
         return True
-    
-    def _pure_literal_elimination(self, assignment: Dict[str, bool]) -> None:
+
+    def _assignment_bitmaps(self, assignment: Dict[str, bool]) -> tuple[int, int, int]:
+        """Pack an assignment dict into truth/assigned/false bitmaps.
+
+        One bit per variable (positions from ``_variable_bits``), so the
+        whole assignment state lives in three machine-dense integers that
+        the mask-based clause checks can consume directly.
+
+        Args:
+            assignment: Variable assignment to pack
+
+        Returns:
+            Tuple of (truth, assigned, false) bitmaps
+        """
+        variable_bits = self._variable_bits
+        truth_bitmap = 0
+        assigned_bitmap = 0
+        for variable, value in assignment.items():
+            bit = 1 << variable_bits[variable]
+            assigned_bitmap |= bit
+            if value:
+                truth_bitmap |= bit
+
+        return truth_bitmap, assigned_bitmap, assigned_bitmap & ~truth_bitmap
+
+    def _pure_literal_elimination(self, assignment: Dict[str, bool],
+                                  trail: Optional[List[str]] = None,
+                                  bitmaps: Optional[tuple[int, int]] = None) -> None:
         """Eliminate pure literals from unassigned variables.
 
         A pure literal appears with only one polarity across all clauses.
         Can safely assign it the value that satisfies all its occurrences.
 
+        Accumulates the positive and negative polarity bitmaps of all
+        not-yet-satisfied clauses in one pass; pure variables are exactly
+        the bits set in one accumulator but not the other.
+
         Args:
             assignment: Variable assignment to modify
+            trail: Optional list recording newly assigned variables for undo
+            bitmaps: Optional precomputed (truth, assigned) bitmaps; packed
+                from the assignment when not given
         """
-        variable_polarities: Dict[str, Set[bool]] = {}
-
-        # Collect polarities for unassigned variables in unsatisfied clauses
-        for clause in self.cnf.clauses:
-            # Skip already satisfied clauses
-            if self._evaluate_clause(clause, assignment) is True:
+        if bitmaps is None:
+            truth_bitmap, assigned_bitmap, false_bitmap = self._assignment_bitmaps(assignment)
+        else:
+            truth_bitmap, assigned_bitmap = bitmaps
+            false_bitmap = assigned_bitmap & ~truth_bitmap
+
+        # Collect polarities occurring in unsatisfied clauses
+        positive_live = 0
+        negative_live = 0
+        for positive_mask, negative_mask in zip(self._positive_masks, self._negative_masks):
+            if (positive_mask & truth_bitmap) | (negative_mask & false_bitmap):
                 continue
-
-            for literal in clause.literals:
-                # Skip already assigned variables
-                if literal.variable in assignment:
-                    continue
-
-                # Track polarities for this variable
-                if literal.variable not in variable_polarities:
-                    variable_polarities[literal.variable] = set()
-                variable_polarities[literal.variable].add(not literal.negated)
-
-        # Assign pure literals (variables with single polarity)
-        for variable, polarities in variable_polarities.items():
-            if len(polarities) == 1:
-                assignment[variable] = next(iter(polarities))
+            positive_live |= positive_mask
+            negative_live |= negative_mask
+
+        # Pure literals appear with exactly one polarity and are unassigned
+        pure_bitmap = (positive_live ^ negative_live) & ~assigned_bitmap
+        if not pure_bitmap:
+            return
+
+        for variable, bit_position in self._variable_bits.items():
+            bit = 1 << bit_position
+            if pure_bitmap & bit:
+                assignment[variable] = bool(positive_live & bit)
+                if trail is not None:
+                    trail.append(variable)
     
-    def _all_clauses_satisfied(self, assignment: Dict[str, bool]) -> bool:
+    def _all_clauses_satisfied(self, assignment: Dict[str, bool],
+                               bitmaps: Optional[tuple[int, int]] = None) -> bool:
         """Check if all clauses are satisfied by the current assignment.
 
+        Evaluates clauses against packed truth/assigned bitmaps so each
+        clause check is a couple of bitwise operations over all of its
+        literals at once, instead of a literal-by-literal walk.
+
         Args:
             assignment: Variable assignment to check
+            bitmaps: Optional precomputed (truth, assigned) bitmaps; packed
+                from the assignment when not given
 
         Returns:
             True if all clauses satisfied, False otherwise
         """
+        if bitmaps is None:
+            truth_bitmap, assigned_bitmap, false_bitmap = self._assignment_bitmaps(assignment)
+        else:
+            truth_bitmap, assigned_bitmap = bitmaps
+            false_bitmap = assigned_bitmap & ~truth_bitmap
+
+        # A clause is satisfied iff some positive literal is assigned True
+        # or some negative literal is assigned False
         return all(
-            self._evaluate_clause(clause, assignment) is True
-            for clause in self.cnf.clauses
+            (positive_mask & truth_bitmap) | (negative_mask & false_bitmap)
+            for positive_mask, negative_mask in zip(self._positive_masks, self._negative_masks)
         )
-    
+
+    def _enumerate_tail(self, assignment: Dict[str, bool],
+                        truth_bitmap: int, assigned_bitmap: int) -> Optional[Dict[str, bool]]:
+        """Test all completions of the remaining free variables at once.
+
+        With k unassigned variables left there are 2^k completions; each
+        is one bit position in a 2^k-bit integer. For every unsatisfied
+        clause, the completions that falsify it are the intersection of
+        the falsifying half-spaces of its unassigned literals, computed
+        with whole-int bitwise ops. Any bit left clear after ORing all
+        those sets is a satisfying completion.
+
+        Args:
+            assignment: Current partial assignment (a propagation fixpoint)
+            truth_bitmap: Packed true-variable bitmap of the assignment
+            assigned_bitmap: Packed assigned-variable bitmap of the assignment
+
+        Returns:
+            Assignment for the free variables completing a model, or None
+            if no completion satisfies the formula
+        """
+        free_variables = [
+            variable for variable in self.variables if variable not in assignment
+        ]
+        completions = 1 << len(free_variables)
+        full_space = (1 << completions) - 1
+
+        # true_space[i]: completions in which free variable i is True;
+        # variable i alternates in blocks of 2^i positions
+        true_spaces: List[int] = []
+        free_slot = {}
+        for slot, variable in enumerate(free_variables):
+            block = 1 << slot
+            unit = ((1 << block) - 1) << block
+            space = 0
+            for offset in range(0, completions, 2 * block):
+                space |= unit << offset
+            true_spaces.append(space)
+            free_slot[self._variable_bits[variable]] = slot
+
+        false_bitmap = assigned_bitmap & ~truth_bitmap
+        falsified_space = 0
+
+        for positive_mask, negative_mask in zip(self._positive_masks, self._negative_masks):
+            if (positive_mask & truth_bitmap) | (negative_mask & false_bitmap):
+                continue
+
+            # Intersect the falsifying half-spaces of the unassigned literals
+            clause_space = full_space
+            unassigned_bits = (positive_mask | negative_mask) & ~assigned_bitmap
+            while unassigned_bits:
+                lowest_bit = unassigned_bits & -unassigned_bits
+                slot_space = true_spaces[free_slot[lowest_bit.bit_length() - 1]]
+                if positive_mask & lowest_bit:
+                    clause_space &= full_space ^ slot_space
+                else:
+                    clause_space &= slot_space
+                unassigned_bits ^= lowest_bit
+
+            falsified_space |= clause_space
+            if falsified_space == full_space:
+                return None
+
+        satisfying = ~falsified_space & full_space
+        completion_index = (satisfying & -satisfying).bit_length() - 1
+        return {
+            variable: bool((completion_index >> slot) & 1)
+            for slot, variable in enumerate(free_variables)
+        }
+
     def _evaluate_clause(self, clause: Clause, assignment: Dict[str, bool]) -> Optional[bool]:
         """Evaluate a clause under the current assignment.
 
@@ -193,22 +557,7 @@ class DPLLSolver:
         Returns:
             True if clause satisfied, False if unsatisfied, None if undetermined
         """
-        unassigned_count = 0
-
-        for literal in clause.literals:
-            if literal.variable not in assignment:
-                unassigned_count += 1
-                continue
-
-            # Check if this literal is satisfied
-            variable_value = assignment[literal.variable]
-            literal_satisfied = self._is_literal_satisfied(literal, variable_value)
-
-            if literal_satisfied:
-                return True
-
-        # No literal satisfied the clause
-        return False if unassigned_count == 0 else None
+        return _evaluate_clause_literals(clause, assignment)
     
     def _choose_variable(self, assignment: Dict[str, bool]) -> str:
         """Choose next unassigned variable for branching.
@@ -219,11 +568,8 @@ class DPLLSolver:
         Returns:
             Variable name to branch on
         """
-        # Collect all variables from clauses
-        all_variables = self._get_all_variables()
-
-        # Find first unassigned variable
-        for variable in all_variables:
+        # Find first unassigned variable from the cached variable set
+        for variable in self.variables:
             if variable not in assignment:
                 return variable
 
@@ -262,172 +608,396 @@ class CDCLSolver:
     clause learning, and non-chronological backtracking.
     """
 
-    def __init__(self, cnf_formula: CNFFormula):
+    def __init__(self, cnf_formula: CNFFormula, seed: Optional[int] = None):
         """Initialize CDCL solver with CNF formula.
 
         Args:
             cnf_formula: CNF formula to solve
+            seed: Optional random seed; when given, fresh variables get a
+                random initial phase instead of True, diversifying the
+                search for portfolio runs
         """
         self.cnf = cnf_formula
+        self.seed = seed
+        self._random = random.Random(seed) if seed is not None else None
         self.assignment: Dict[str, bool] = {}
         self.decision_stack: List[Assignment] = []
         self.learned_clauses: List[Clause] = []
         self.decision_level = 0
         self.implication_graph: Dict[str, ImplicationNode] = {}
-        
+        self.restart_unit = 100
+        self.restart_index = 1
+        self.conflicts_since_restart = 0
+        self.total_conflicts = 0
+        self.reduce_interval = 2000
+        self.saved_phase: Dict[str, bool] = {}
+        self.variables: Set[str] = {
+            literal.variable
+            for clause in cnf_formula.clauses
+            for literal in clause.literals
+        }
+        # How often each variable occurs in the formula; rarely occurring
+        # variables are assigned less often, making them better watches
+        self._occurrence_counts: Dict[str, int] = {}
+        for clause in cnf_formula.clauses:
+            for literal in clause.literals:
+                self._occurrence_counts[literal.variable] = (
+                    self._occurrence_counts.get(literal.variable, 0) + 1
+                )
+        # VSIDS state: per-variable activity scores bumped on conflict
+        # participation, with a lazy max-heap for variable selection
+        self._activity: Dict[str, float] = {variable: 0.0 for variable in self.variables}
+        self._activity_increment = 1.0
+        self._order_heap: List[tuple[float, str]] = [
+            (0.0, variable) for variable in self.variables
+        ]
+        heapq.heapify(self._order_heap)
+        # Two-watched-literals state: each clause watches two of its
+        # literals; a clause is only revisited when a watched literal
+        # becomes false
+        self._watched_clauses: List[Optional[Clause]] = []
+        self._watch_positions: List[List[int]] = []
+        self._watches: Dict[tuple[str, bool], List[tuple[int, Literal]]] = {}
+        # Binary clauses bypass the watch scheme entirely: falsifying
+        # either literal directly implies the other, so they live in a
+        # per-literal implication list instead
+        self._binary_implications: Dict[tuple[str, bool], List[tuple[Literal, Clause]]] = {}
+        self._pending_clauses: List[int] = []
+        self._clause_index: Dict[int, int] = {}
+        self._clause_glue: Dict[int, int] = {}
+        # Sorted-literal signatures of solver-learned clauses, to avoid
+        # storing the same clause twice across restarts
+        self._learned_signatures: Dict[tuple, Clause] = {}
+        self._registered_original = 0
+        self._registered_learned = 0
+        self._propagation_index = 0
+
     def _unit_propagation(self) -> Optional[Clause]:
         """Apply unit propagation to current assignment.
 
-        For each unit clause (only one unassigned literal), forces that literal's value.
-        Continues until no more unit clauses or conflict found.
+        Uses the two-watched-literals scheme: each clause watches two of
+        its literals and is only revisited when one of them is falsified,
+        so propagation touches only the affected watch lists instead of
+        rescanning every clause per round.
 
         Returns:
             Conflict clause if conflict detected, None otherwise
         """
-        while True:
-            propagated = False
+        self._register_new_clauses()
 
-            for clause in self.cnf.clauses + self.learned_clauses:
-                clause_state = self._evaluate_clause(clause)
+        # Clauses that were already unit or falsified when registered
+        pending_clauses, self._pending_clauses = self._pending_clauses, []
+        for clause_index in pending_clauses:
+            conflict = self._examine_clause(clause_index)
+            if conflict is not None:
+                return conflict
 
-                # Check for conflict
-                if clause_state is False:
-                    return clause
+        # Process the trail from the propagation head onward
+        while self._propagation_index < len(self.decision_stack):
+            trail_entry = self.decision_stack[self._propagation_index]
+            self._propagation_index += 1
 
-                # Skip satisfied or undetermined non-unit clauses
-                if clause_state is True:
-                    continue
+            conflict = self._visit_watchers(trail_entry.variable, trail_entry.value)
+            if conflict is not None:
+                return conflict
 
-                # Find unassigned literals in undetermined clause
-                unassigned_literals = [
-                    literal for literal in clause.literals
-                    if literal.variable not in self.assignment
-                ]
+        return None
 
-                # Process unit clause (exactly one unassigned literal)
-                if len(unassigned_literals) == 1:
-                    unit_literal = unassigned_literals[0]
-                    implied_value = not unit_literal.negated
-                    self._add_implication(unit_literal.variable, implied_value, clause)
-                    propagated = True
+    def _visit_watchers(self, variable: str, value: bool) -> Optional[Clause]:
+        """Visit clauses watching the literal falsified by an assignment.
 
-            if not propagated:
-                break
-
-        return None
-    
-    def _evaluate_clause(self, clause: Clause) -> Optional[bool]:
-        """Evaluate a clause under the current assignment.
+        For each watching clause, first tests the cached blocking literal
+        (a literal recently known to satisfy the clause) to skip the
+        clause without touching its literal list; otherwise tries to move
+        the watch to another non-false literal. Failing that, the clause
+        is unit (implication) or falsified (conflict).
 
         Args:
-            clause: Clause to evaluate
+            variable: Variable that was just assigned
+            value: Value it was assigned
 
         Returns:
-            True if clause satisfied, False if unsatisfied, None if undetermined
+            Conflict clause if one is found, None otherwise
         """
-        unassigned_count = 0
+        # A literal (variable, negated) is falsified when value == negated
+        falsified_key = (variable, value)
+
+        # Binary clauses first: each edge is a direct implication with
+        # no watch bookkeeping at all
+        for implied_literal, reason in self._binary_implications.get(falsified_key, ()):
+            implied_value = self._literal_value(implied_literal)
+            if implied_value is None:
+                self._add_implication(implied_literal.variable,
+                                      not implied_literal.negated, reason)
+            elif implied_value is False:
+                return reason
+
+        watchers = self._watches.get(falsified_key, [])
+        remaining: List[tuple[int, Literal]] = []
+
+        for position, (clause_index, blocking_literal) in enumerate(watchers):
+            # Blocking literal satisfied: clause is satisfied, skip it
+            # without dereferencing the clause at all
+            if self._literal_value(blocking_literal) is True:
+                remaining.append((clause_index, blocking_literal))
+                continue
 
-        for literal in clause.literals:
-            if literal.variable not in self.assignment:
-                unassigned_count += 1
+            clause = self._watched_clauses[clause_index]
+            watch_pair = self._watch_positions[clause_index]
+
+            # Identify the falsified watch and the companion watch
+            first_literal = clause.literals[watch_pair[0]]
+            if (first_literal.variable, first_literal.negated) == falsified_key:
+                falsified_slot, other_slot = 0, 1
+            else:
+                falsified_slot, other_slot = 1, 0
+            other_literal = clause.literals[watch_pair[other_slot]]
+
+            # Clause already satisfied by the companion watch; cache it as
+            # the new blocking literal
+            if self._literal_value(other_literal) is True:
+                remaining.append((clause_index, other_literal))
                 continue
 
-            # Check if this literal is satisfied
-            variable_value = self.assignment[literal.variable]
-            literal_satisfied = (not literal.negated and variable_value) or (literal.negated and not variable_value)
+            # Try to move the watch to another non-false literal
+            replacement = self._find_replacement_watch(clause, watch_pair)
+            if replacement is not None:
+                watch_pair[falsified_slot] = replacement
+                new_literal = clause.literals[replacement]
+                new_key = (new_literal.variable, new_literal.negated)
+                self._watches.setdefault(new_key, []).append((clause_index, other_literal))
+                continue
 
-            if literal_satisfied:
-                return True
+            # No replacement: clause is unit on the companion watch or falsified
+            remaining.append((clause_index, other_literal))
+            other_value = self._literal_value(other_literal)
+            if other_value is None:
+                self._add_implication(other_literal.variable, not other_literal.negated, clause)
+            elif other_value is False:
+                remaining.extend(watchers[position + 1:])
+                self._watches[falsified_key] = remaining
+                return clause
+
+        self._watches[falsified_key] = remaining
+        return None
 
-        # No literal satisfied the clause
-        return False if unassigned_count == 0 else None
-    
-    def _analyze_conflict(self, conflict_clause: Clause) -> Clause:
-        """Analyze conflict to derive learned clause using First Unique Implication Point (1UIP).
+    def _find_replacement_watch(self, clause: Clause, watch_pair: List[int]) -> Optional[int]:
+        """Find an unwatched, non-false literal to watch in a clause.
 
-        Performs iterative resolution starting from the conflict clause until reaching
-        a clause with at most one variable from the current decision level (1UIP condition).
+        Args:
+            clause: Clause whose watch needs to move
+            watch_pair: Current watched literal positions
+
+        Returns:
+            Index of a replacement literal, None if all candidates are false
+        """
+        for index, literal in enumerate(clause.literals):
+            if index in watch_pair:
+                continue
+            if self._literal_value(literal) is not False:
+                return index
+        return None
+
+    def _literal_value(self, literal: Literal) -> Optional[bool]:
+        """Evaluate a single literal under the current assignment.
 
         Args:
-            conflict_clause: The clause that caused the conflict
+            literal: Literal to evaluate
 
         Returns:
-            Learned clause that prevents similar conflicts
+            True/False if the variable is assigned, None otherwise
         """
-        # Base case: conflicts at decision level 0 are unresolvable
-        if self.decision_level == 0:
-            return conflict_clause
+        variable_value = self.assignment.get(literal.variable)
+        if variable_value is None:
+            return None
+        return variable_value != literal.negated
+
+    def _register_new_clauses(self) -> None:
+        """Register watches for clauses added since the last propagation.
 
-        resolvent_clause = conflict_clause
+        Covers both original clauses (on the first call) and learned
+        clauses appended afterwards.
+        """
+        while self._registered_original < len(self.cnf.clauses):
+            self._register_clause(self.cnf.clauses[self._registered_original])
+            self._registered_original += 1
 
-        # Iteratively resolve until 1UIP condition is satisfied
-        while not self._is_first_unique_implication_point(resolvent_clause):
-            # Find the next variable to resolve on (most recently assigned at current level)
-            resolution_variable = self._find_most_recent_current_level_variable(resolvent_clause)
+        while self._registered_learned < len(self.learned_clauses):
+            self._register_clause(self.learned_clauses[self._registered_learned])
+            self._registered_learned += 1
 
-            if not self._can_resolve_on_variable(resolution_variable):
-                # Cannot resolve further - return current clause as learned clause
-                return resolvent_clause
+    def _register_clause(self, clause: Clause) -> None:
+        """Set up watched literals for a clause.
 
-            # Perform resolution step
-            reason_clause = self.implication_graph[resolution_variable].reason
-            resolvent_clause = self._resolve_clauses(
-                resolvent_clause,
-                reason_clause,
-                resolution_variable
-            )
+        Prefers non-false literals as watches; among false literals the
+        most recently assigned ones are chosen so the watches unassign
+        first on backtracking. The clause is queued for an immediate
+        state check since it may already be unit or falsified.
 
-        return resolvent_clause
+        Args:
+            clause: Clause to register
+        """
+        clause_index = len(self._watched_clauses)
+        self._watched_clauses.append(clause)
+        self._clause_index[id(clause)] = clause_index
+
+        if not clause.literals:
+            # Empty clause: no watches possible; the pending check
+            # reports it as an immediate conflict
+            self._watch_positions.append([])
+            self._pending_clauses.append(clause_index)
+            return
+
+        if len(clause.literals) == 2:
+            # Binary clause a ∨ b is the implication pair ¬a → b and
+            # ¬b → a; record both edges and skip the watch lists
+            first_literal, second_literal = clause.literals
+            self._watch_positions.append([])
+            self._binary_implications.setdefault(
+                (first_literal.variable, first_literal.negated), []
+            ).append((second_literal, clause))
+            self._binary_implications.setdefault(
+                (second_literal.variable, second_literal.negated), []
+            ).append((first_literal, clause))
+            self._pending_clauses.append(clause_index)
+            return
+
+        candidates = sorted(
+            range(len(clause.literals)),
+            key=lambda index: self._watch_priority(clause.literals[index]),
+        )
+        first = candidates[0]
+        second = candidates[1] if len(candidates) > 1 else candidates[0]
+        self._watch_positions.append([first, second])
 
-    def _is_first_unique_implication_point(self, clause: Clause) -> bool:
-        """Check if clause satisfies 1UIP condition.
+        for slot in {first, second}:
+            literal = clause.literals[slot]
+            key = (literal.variable, literal.negated)
+            # The companion watch serves as the initial blocking literal
+            other_slot = second if slot == first else first
+            blocking_literal = clause.literals[other_slot]
+            self._watches.setdefault(key, []).append((clause_index, blocking_literal))
 
-        1UIP condition: at most one variable from current decision level.
+        self._pending_clauses.append(clause_index)
+
+    def _watch_priority(self, literal: Literal) -> tuple[int, int]:
+        """Rank a literal as a watch candidate (lower is better).
+
+        Non-false literals come first, rarest variables leading since
+        they are assigned (and thus falsified) least often; false
+        literals are ordered by descending decision level.
 
         Args:
-            clause: Clause to check
+            literal: Candidate watch literal
 
         Returns:
-            True if clause satisfies 1UIP condition
+            Sort key for watch selection
         """
-        return self._count_current_level_variables(clause) <= 1
+        if self._literal_value(literal) is not False:
+            return (0, self._occurrence_counts.get(literal.variable, 0))
+
+        node = self.implication_graph.get(literal.variable)
+        level = node.decision_level if node is not None else 0
+        return (1, -level)
 
-    def _count_current_level_variables(self, clause: Clause) -> int:
-        """Count variables in clause that belong to current decision level.
+    def _examine_clause(self, clause_index: int) -> Optional[Clause]:
+        """Check a newly registered clause against the current assignment.
 
         Args:
-            clause: Clause to analyze
+            clause_index: Index of the clause in the watched database
 
         Returns:
-            Number of variables from current decision level
+            The clause if it is falsified, None otherwise
         """
-        return sum(
-            1 for literal in clause.literals
-            if self._is_variable_at_current_level(literal.variable)
-        )
+        clause = self._watched_clauses[clause_index]
+        # A queued index can go stale if clause-database reduction dropped
+        # the clause before propagation got to it
+        if clause is None:
+            return None
+        clause_state = self._evaluate_clause(clause)
+
+        if clause_state is False:
+            return clause
+
+        if clause_state is None:
+            unassigned_literals = [
+                literal for literal in clause.literals
+                if literal.variable not in self.assignment
+            ]
+            if len(unassigned_literals) == 1:
+                unit_literal = unassigned_literals[0]
+                self._add_implication(unit_literal.variable, not unit_literal.negated, clause)
+
+        return None
 
-    def _find_most_recent_current_level_variable(self, clause: Clause) -> Optional[str]:
-        """Find the most recently assigned variable in clause at current decision level.
+    def _evaluate_clause(self, clause: Clause) -> Optional[bool]:
+        """Evaluate a clause under the current assignment.
 
         Args:
-            clause: Clause to search in
+            clause: Clause to evaluate
 
         Returns:
-            Most recently assigned variable at current level, None if none found
+            True if clause satisfied, False if unsatisfied, None if undetermined
         """
-        current_level_variables = [
-            literal.variable for literal in clause.literals
-            if self._is_variable_at_current_level(literal.variable)
-        ]
+        return _evaluate_clause_literals(clause, self.assignment)
+    
+    def _analyze_conflict(self, conflict_clause: Clause) -> Clause:
+        """Analyze conflict to derive learned clause using First Unique Implication Point (1UIP).
 
-        if not current_level_variables:
-            return None
+        Performs iterative resolution starting from the conflict clause until reaching
+        a clause with at most one variable from the current decision level (1UIP condition).
 
-        # Find variable with highest assignment index (most recent)
-        return max(
-            current_level_variables,
-            key=self._find_variable_assignment_index
-        )
+        Args:
+            conflict_clause: The clause that caused the conflict
+
+        Returns:
+            Learned clause that prevents similar conflicts
+        """
+        # Base case: conflicts at decision level 0 are unresolvable
+        if self.decision_level == 0:
+            return conflict_clause
+
+        # Counter-based 1UIP: literals below the current level go straight
+        # into the resolvent, current-level variables are tracked in a
+        # pending set, and pivots are found by walking the trail top-down
+        # instead of re-scanning the resolvent per resolution step
+        resolvent: Dict[tuple[str, bool], Literal] = {}
+        unresolved: Dict[str, Literal] = {}
+
+        def merge(clause: Clause, pivot: Optional[str]) -> None:
+            for literal in clause.literals:
+                variable = literal.variable
+                if variable == pivot:
+                    continue
+                if self._is_variable_at_current_level(variable):
+                    unresolved.setdefault(variable, literal)
+                else:
+                    resolvent.setdefault((variable, literal.negated), literal)
+
+        merge(conflict_clause, None)
+        trail_index = len(self.decision_stack) - 1
+
+        # 1UIP condition: exactly one current-level variable left
+        while len(unresolved) > 1:
+            # The next pivot is the most recently assigned unresolved variable
+            while (trail_index >= 0 and
+                   self.decision_stack[trail_index].variable not in unresolved):
+                trail_index -= 1
+
+            if trail_index < 0:
+                break
+
+            pivot = self.decision_stack[trail_index].variable
+            trail_index -= 1
+
+            if not self._can_resolve_on_variable(pivot):
+                # Cannot resolve further - return current resolvent as learned clause
+                break
+
+            del unresolved[pivot]
+            merge(self.implication_graph[pivot].reason, pivot)
+
+        return Clause(list(unresolved.values()) + list(resolvent.values()))
 
     def _is_variable_at_current_level(self, variable: str) -> bool:
         """Check if variable belongs to current decision level.
@@ -441,21 +1011,6 @@ class CDCLSolver:
         return (variable in self.implication_graph and
                 self.implication_graph[variable].decision_level == self.decision_level)
 
-    def _find_variable_assignment_index(self, variable: str) -> int:
-        """Find index of variable assignment in decision stack at current level.
-
-        Args:
-            variable: Variable to find
-
-        Returns:
-            Index in decision stack, -1 if not found
-        """
-        for index, assignment in enumerate(self.decision_stack):
-            if (assignment.variable == variable and
-                assignment.decision_level == self.decision_level):
-                return index
-        return -1
-
     def _can_resolve_on_variable(self, variable: Optional[str]) -> bool:
         """Check if resolution can be performed on the given variable.
 
@@ -472,44 +1027,72 @@ class CDCLSolver:
         return (implication_node is not None and
                 implication_node.reason is not None)
 
-    def _resolve_clauses(self, clause1: Clause, clause2: Clause, pivot_var: str) -> Clause:
-        """Resolve two clauses on pivot variable.
+    def _minimize_learned_clause(self, learned_clause: Clause) -> Clause:
+        """Remove redundant literals from a learned clause.
+
+        A literal is redundant if its negation is already implied by the
+        remaining literals through the implication graph, so dropping it
+        preserves the clause's meaning while making it shorter and stronger.
+        Literals at the current decision level are always kept so the
+        clause stays asserting after backjumping.
 
         Args:
-            clause1: First clause in resolution
-            clause2: Second clause in resolution
-            pivot_var: Variable to resolve on
+            learned_clause: Clause produced by conflict analysis
 
         Returns:
-            Resolved clause without pivot variable
+            Equivalent clause with redundant literals removed
         """
-        resolved_literals: List[Literal] = []
+        clause_variables = {literal.variable for literal in learned_clause.literals}
+        redundancy_cache: Dict[str, bool] = {}
 
-        # Collect all non-pivot literals from both clauses
-        for clause in [clause1, clause2]:
-            for literal in clause.literals:
-                if (literal.variable != pivot_var and
-                    not self._literal_exists(literal, resolved_literals)):
-                    resolved_literals.append(literal)
+        kept_literals = [
+            literal for literal in learned_clause.literals
+            if (self._is_variable_at_current_level(literal.variable) or
+                not self._is_redundant_literal(literal.variable, clause_variables, redundancy_cache))
+        ]
 
-        return Clause(resolved_literals)
+        if len(kept_literals) == len(learned_clause.literals):
+            return learned_clause
+        return Clause(kept_literals)
 
-    def _literal_exists(self, literal: Literal, literal_list: List[Literal]) -> bool:
-        """Check if literal already exists in list.
+    def _is_redundant_literal(self, variable: str, clause_variables: Set[str],
+                              redundancy_cache: Dict[str, bool]) -> bool:
+        """Check whether a learned-clause literal is redundant.
+
+        A literal is redundant if its variable was implied (not decided)
+        and every antecedent in its reason clause is either already in the
+        learned clause or itself redundant (checked recursively).
 
         Args:
-            literal: Literal to search for
-            literal_list: List of literals to search in
+            variable: Variable of the literal to check
+            clause_variables: Variables present in the learned clause
+            redundancy_cache: Memoized results for variables already checked
 
         Returns:
-            True if literal exists in list, False otherwise
+            True if the literal can be safely removed
         """
-        return any(
-            existing_literal.variable == literal.variable and
-            existing_literal.negated == literal.negated
-            for existing_literal in literal_list
-        )
-    
+        if variable in redundancy_cache:
+            return redundancy_cache[variable]
+
+        implication_node = self.implication_graph.get(variable)
+        if implication_node is None or implication_node.reason is None:
+            redundancy_cache[variable] = False
+            return False
+
+        # Mark as non-redundant while exploring to be safe against re-entry
+        redundancy_cache[variable] = False
+
+        for reason_literal in implication_node.reason.literals:
+            if reason_literal.variable == variable:
+                continue
+            if reason_literal.variable in clause_variables:
+                continue
+            if not self._is_redundant_literal(reason_literal.variable, clause_variables, redundancy_cache):
+                return False
+
+        redundancy_cache[variable] = True
+        return True
+
     def _backjump(self, learned_clause: Clause) -> int:
         """Determine backjump level for non-chronological backtracking.
 
@@ -552,6 +1135,9 @@ class CDCLSolver:
             self._remove_current_level_assignments()
             self.decision_level -= 1
 
+        # Unwound assignments no longer need propagation
+        self._propagation_index = min(self._propagation_index, len(self.decision_stack))
+
     def _remove_current_level_assignments(self):
         """Remove all assignments from the current decision level.
 
@@ -563,6 +1149,11 @@ class CDCLSolver:
                self.decision_stack[-1].decision_level == self.decision_level):
             assignment = self.decision_stack.pop()
             del self.assignment[assignment.variable]
+            # Unassigned variables become selectable again
+            heapq.heappush(
+                self._order_heap,
+                (-self._activity.get(assignment.variable, 0.0), assignment.variable),
+            )
             if assignment.variable in self.implication_graph:
                 del self.implication_graph[assignment.variable]
     
@@ -572,8 +1163,25 @@ class CDCLSolver:
         Returns:
             Variable name to branch on, None if all variables assigned
         """
-        # Find first unassigned variable from any clause
-        for clause in self.cnf.clauses + self.learned_clauses:
+        # Pop the most active unassigned variable (VSIDS). Entries whose
+        # score no longer matches the current activity are stale copies
+        # superseded by a later push and are skipped.
+        while self._order_heap:
+            negated_activity, variable = heapq.heappop(self._order_heap)
+            if variable in self.assignment:
+                continue
+            if -negated_activity != self._activity.get(variable, 0.0):
+                continue
+            return variable
+
+        # Safety net: the heap should cover every formula variable, but
+        # fall back to the cached set before declaring all assigned
+        for variable in self.variables:
+            if variable not in self.assignment:
+                return variable
+
+        # Learned clauses may mention variables added after construction
+        for clause in self.learned_clauses:
             for literal in clause.literals:
                 if literal.variable not in self.assignment:
                     return literal.variable
@@ -593,6 +1201,7 @@ class CDCLSolver:
         assignment = Assignment(variable, value, self.decision_level, None)
         self.decision_stack.append(assignment)
         self.assignment[variable] = value
+        self.saved_phase[variable] = value
 
         node = ImplicationNode(variable, value, self.decision_level, None, [])
         self.implication_graph[variable] = node
@@ -612,17 +1221,12 @@ class CDCLSolver:
         assignment = Assignment(variable, value, self.decision_level, reason)
         self.decision_stack.append(assignment)
         self.assignment[variable] = value
+        self.saved_phase[variable] = value
 
-        # Build antecedent nodes for implication graph
-        antecedent_nodes = [
-            self.implication_graph[literal.variable]
-            for literal in reason.literals
-            if (literal.variable != variable and
-                literal.variable in self.implication_graph)
-        ]
-
-        # Create implication node
-        node = ImplicationNode(variable, value, self.decision_level, reason, antecedent_nodes)
+        # Create implication node; antecedents are derived from the
+        # reason clause only if something actually reads them
+        node = ImplicationNode(variable, value, self.decision_level, reason,
+                               graph=self.implication_graph)
         self.implication_graph[variable] = node
     
     
@@ -664,19 +1268,202 @@ class CDCLSolver:
         # Analyze: derive learned clause from conflict
         learned_clause = self._analyze_conflict(conflict_clause)
 
-        # Learn: add learned clause to prevent similar conflicts
-        self.learned_clauses.append(learned_clause)
+        # Minimize: drop literals implied by the rest of the clause
+        learned_clause = self._minimize_learned_clause(learned_clause)
+
+        # Learn: add learned clause to prevent similar conflicts. An
+        # identical clause may already be in the database (restarts can
+        # reproduce a conflict); reuse it instead of storing a duplicate
+        signature = tuple(sorted(
+            (literal.variable, literal.negated) for literal in learned_clause.literals
+        ))
+        existing_clause = self._learned_signatures.get(signature)
+        if existing_clause is not None:
+            learned_clause = existing_clause
+            # Re-examine the stored copy so its unit implication fires
+            # again after the backjump
+            clause_index = self._clause_index.get(id(existing_clause))
+            if clause_index is not None:
+                self._pending_clauses.append(clause_index)
+        else:
+            self._learned_signatures[signature] = learned_clause
+            self.learned_clauses.append(learned_clause)
+            self._clause_glue[id(learned_clause)] = self._compute_glue(learned_clause)
+
+        # Bump activity of the variables involved in this conflict
+        self._bump_clause_activity(learned_clause)
 
         # Check for unsatisfiability (conflict at decision level 0)
         if self.decision_level == 0:
             return DecisionResult.UNSAT
 
-        # Backjump: perform non-chronological backtracking
-        backjump_level = self._backjump(learned_clause)
-        self._backtrack_to_level(backjump_level)
+        # Restart: periodically abandon the current branch, keeping learned clauses
+        self.total_conflicts += 1
+        self.conflicts_since_restart += 1
+        if self.conflicts_since_restart >= self._luby(self.restart_index) * self.restart_unit:
+            self._restart()
+        else:
+            # Backjump: perform non-chronological backtracking
+            backjump_level = self._backjump(learned_clause)
+            self._backtrack_to_level(backjump_level)
+
+        # Periodically shed low-value learned clauses to bound the database
+        if self.total_conflicts % self.reduce_interval == 0:
+            self._reduce_learned_clauses()
 
         return None
 
+    def _compute_glue(self, clause: Clause) -> int:
+        """Compute the glue (LBD) of a clause at learning time.
+
+        Glue is the number of distinct decision levels among the clause's
+        literals; low-glue clauses tend to stay useful.
+
+        Args:
+            clause: Freshly learned clause
+
+        Returns:
+            Number of distinct decision levels in the clause
+        """
+        return len({
+            self.implication_graph[literal.variable].decision_level
+            for literal in clause.literals
+            if literal.variable in self.implication_graph
+        })
+
+    def _reduce_learned_clauses(self):
+        """Drop the least useful half of the learned-clause database.
+
+        Clauses are ranked by glue (lower is better); low-glue clauses,
+        clauses currently acting as a reason on the trail, and clauses
+        not yet registered with the watch engine are kept. Watches of
+        dropped clauses are removed eagerly.
+        """
+        registered = self.learned_clauses[:self._registered_learned]
+        unregistered = self.learned_clauses[self._registered_learned:]
+        if len(registered) < 20:
+            return
+
+        reason_ids = {
+            id(assignment.reason) for assignment in self.decision_stack
+            if assignment.reason is not None
+        }
+
+        ranked = sorted(registered, key=lambda clause: self._clause_glue.get(id(clause), 99))
+        dropped_ids = {
+            id(clause) for clause in ranked[len(ranked) // 2:]
+            if id(clause) not in reason_ids and self._clause_glue.get(id(clause), 99) > 2
+        }
+
+        for clause in registered:
+            if id(clause) in dropped_ids:
+                self._unregister_clause(clause)
+                self._learned_signatures.pop(tuple(sorted(
+                    (literal.variable, literal.negated) for literal in clause.literals
+                )), None)
+
+        self.learned_clauses = [
+            clause for clause in registered if id(clause) not in dropped_ids
+        ] + unregistered
+        self._registered_learned = len(self.learned_clauses) - len(unregistered)
+
+    def _unregister_clause(self, clause: Clause):
+        """Remove a clause from the watch structures.
+
+        Args:
+            clause: Clause being dropped from the database
+        """
+        clause_index = self._clause_index.pop(id(clause), None)
+        if clause_index is None:
+            return
+
+        if len(clause.literals) == 2:
+            for literal in clause.literals:
+                edges = self._binary_implications.get((literal.variable, literal.negated))
+                if edges is not None:
+                    self._binary_implications[(literal.variable, literal.negated)] = [
+                        edge for edge in edges if edge[1] is not clause
+                    ]
+
+        for slot in set(self._watch_positions[clause_index]):
+            literal = clause.literals[slot]
+            watchers = self._watches.get((literal.variable, literal.negated))
+            if watchers is not None:
+                self._watches[(literal.variable, literal.negated)] = [
+                    entry for entry in watchers if entry[0] != clause_index
+                ]
+
+        self._watched_clauses[clause_index] = None
+        self._watch_positions[clause_index] = []
+        self._clause_glue.pop(id(clause), None)
+
+    def _bump_clause_activity(self, clause: Clause):
+        """Increase activity of all variables in a learned clause.
+
+        Implements VSIDS scoring: recent conflict participants get higher
+        scores, and the shared increment grows geometrically so older
+        bumps decay relative to new ones.
+
+        Args:
+            clause: Learned clause whose variables are bumped
+        """
+        for literal in clause.literals:
+            variable = literal.variable
+            activity = self._activity.get(variable, 0.0) + self._activity_increment
+            self._activity[variable] = activity
+            heapq.heappush(self._order_heap, (-activity, variable))
+
+        self._activity_increment /= 0.95
+        if self._activity_increment > 1e100:
+            self._rescale_activities()
+
+    def _rescale_activities(self):
+        """Scale all activities down to avoid float overflow.
+
+        Relative ordering is preserved; the heap is rebuilt from the
+        rescaled scores of unassigned variables.
+        """
+        self._activity = {
+            variable: activity * 1e-100
+            for variable, activity in self._activity.items()
+        }
+        self._activity_increment *= 1e-100
+        self._order_heap = [
+            (-activity, variable)
+            for variable, activity in self._activity.items()
+            if variable not in self.assignment
+        ]
+        heapq.heapify(self._order_heap)
+
+    def _restart(self):
+        """Restart the search from decision level 0.
+
+        Learned clauses are retained, so progress from conflict analysis
+        is not lost. The restart interval follows the Luby sequence.
+        """
+        self._backtrack_to_level(0)
+        self.conflicts_since_restart = 0
+        self.restart_index += 1
+
+    @staticmethod
+    def _luby(index: int) -> int:
+        """Compute the index-th term of the Luby sequence (1-based).
+
+        The sequence 1, 1, 2, 1, 1, 2, 4, ... is the standard schedule
+        for restart intervals in modern SAT solvers.
+
+        Args:
+            index: Position in the sequence (starting from 1)
+
+        Returns:
+            Luby value at the given position
+        """
+        while True:
+            k = index.bit_length()
+            if index == (1 << k) - 1:
+                return 1 << (k - 1)
+            index -= (1 << (k - 1)) - 1
+
     def _make_next_decision(self) -> bool:
         """Make the next decision assignment.
 
@@ -687,5 +1474,64 @@ class CDCLSolver:
         if variable is None:
             return False
 
-        self._make_decision(variable, True)
-        return True
\ No newline at end of file
+        self._make_decision(variable, self._pick_branch_value(variable))
+        return True
+
+    def _pick_branch_value(self, variable: str) -> bool:
+        """Pick the value to try first when deciding a variable.
+
+        Uses phase saving: the polarity the variable last held before
+        backtracking is reused, keeping the search close to the subtree
+        it already found productive. Fresh variables default to True, or
+        to a random phase when the solver was seeded.
+
+        Args:
+            variable: Variable about to be decided
+
+        Returns:
+            Value to assign first
+        """
+        saved = self.saved_phase.get(variable)
+        if saved is not None:
+            return saved
+        if self._random is not None:
+            return self._random.random() < 0.5
+        return True
+
+def _portfolio_worker(args: tuple[CNFFormula, int]) -> DecisionResult:
+    """Run one seeded CDCL solver; used by solve_portfolio workers.
+
+    Args:
+        args: Tuple of (formula, seed)
+
+    Returns:
+        SAT or UNSAT
+    """
+    cnf_formula, seed = args
+    return CDCLSolver(cnf_formula, seed=seed).solve()
+
+
+def solve_portfolio(cnf_formula: CNFFormula, num_workers: int = 4) -> DecisionResult:
+    """Solve a formula with a portfolio of seeded CDCL solvers.
+
+    Launches num_workers processes, each running CDCLSolver with a
+    different seed so their initial phase choices diverge; the first
+    worker to finish decides the answer and the rest are terminated.
+    Every worker solves the same formula, so any answer is correct.
+
+    Args:
+        cnf_formula: CNF formula to solve
+        num_workers: Number of solver processes to launch
+
+    Returns:
+        SAT or UNSAT
+    """
+    if num_workers <= 1:
+        return CDCLSolver(cnf_formula).solve()
+
+    with multiprocessing.Pool(processes=num_workers) as pool:
+        tasks = [(cnf_formula, seed) for seed in range(num_workers)]
+        results = pool.imap_unordered(_portfolio_worker, tasks)
+        result = next(iter(results))
+        pool.terminate()
+        return result
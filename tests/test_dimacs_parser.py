@@ -157,6 +157,18 @@ p cnf 1 1
         assert len(cnf.clauses[0].literals) == 1
         assert cnf.clauses[0].literals[0].variable == "x1"
 
+    def test_duplicate_literals_deduplicated(self):
+        dimacs_content = """p cnf 2 1
+1 1 -2 0"""
+
+        cnf = parse_dimacs_string(dimacs_content)
+
+        assert len(cnf.clauses) == 1
+        clause = cnf.clauses[0]
+        assert len(clause.literals) == 2
+        assert clause.literals[0].variable == "x1"
+        assert clause.literals[1].variable == "x2"
+
 
 class TestParseDimacsFile:
     
@@ -8,6 +8,10 @@ class TestTokenize:
     def test_single_variable(self):
         assert tokenize("p") == ["p"]
         assert tokenize("A") == ["A"]
+
+    def test_unicode_variable(self):
+        assert tokenize("α") == ["α"]
+        assert tokenize("α ∧ β1") == ["α", "∧", "β1"]
     
     def test_basic_operators(self):
         assert tokenize("¬p") == ["¬", "p"]
@@ -48,24 +52,25 @@ class TestParser:
         tokens = ["p", "∧", "q"]
         parser = Parser(tokens)
         assert parser.tokens == tokens
-        assert parser.position == 0
-    
+        assert parser.peek() == "p"
+
     def test_peek(self):
         parser = Parser(["p", "∧", "q"])
         assert parser.peek() == "p"
-        assert parser.position == 0
-    
+        # Peeking does not advance the parser
+        assert parser.peek() == "p"
+
     def test_peek_at_end(self):
         parser = Parser(["p"])
-        parser.position = 1
+        parser.consume()
         assert parser.peek() is None
-    
+
     def test_consume(self):
         parser = Parser(["p", "∧", "q"])
         assert parser.consume() == "p"
-        assert parser.position == 1
+        assert parser.peek() == "∧"
         assert parser.consume() == "∧"
-        assert parser.position == 2
+        assert parser.peek() == "q"
     
     def test_consume_at_end(self):
         parser = Parser(["p"])
@@ -116,27 +121,72 @@ class TestParser:
         assert isinstance(result, Variable)
         assert result.name == "p"
     
-    def test_parse_and_simple(self):
-        parser = Parser(["p", "∧", "q"])
-        result = parser.parse_and()
-        assert isinstance(result, And)
+    # One entry per binary connective: token, AST node class, Parser
+    # method, and associativity of repeated applications
+    BINARY_OPS = [
+        ("∧", And, "parse_and", "left"),
+        ("∨", Or, "parse_or", "left"),
+        ("→", Implies, "parse_implication", "right"),
+        ("↔", Biconditional, "parse_biconditional", "left"),
+    ]
+
+    # Each connective paired with the next-tighter one that should bind
+    # inside it: inner token, inner AST node class
+    PRECEDENCE_CASES = [
+        ("∨", Or, "parse_or", "∧", And),
+        ("→", Implies, "parse_implication", "∨", Or),
+        ("↔", Biconditional, "parse_biconditional", "→", Implies),
+    ]
+
+    @pytest.mark.parametrize("op,node_cls,method,assoc", BINARY_OPS)
+    def test_parse_binary_simple(self, op, node_cls, method, assoc):
+        parser = Parser(["p", op, "q"])
+        result = getattr(parser, method)()
+        assert isinstance(result, node_cls)
         assert isinstance(result.left, Variable)
         assert result.left.name == "p"
         assert isinstance(result.right, Variable)
         assert result.right.name == "q"
-    
-    def test_parse_and_multiple(self):
-        parser = Parser(["p", "∧", "q", "∧", "r"])
-        result = parser.parse_and()
-        assert isinstance(result, And)
-        assert isinstance(result.left, And)
+
+    @pytest.mark.parametrize("op,node_cls,method,assoc", BINARY_OPS)
+    def test_parse_binary_chain_associativity(self, op, node_cls, method, assoc):
+        parser = Parser(["p", op, "q", op, "r"])
+        result = getattr(parser, method)()
+        assert isinstance(result, node_cls)
+        if assoc == "left":
+            nested, nested_names = result.left, ("p", "q")
+            leaf, leaf_name = result.right, "r"
+        else:
+            nested, nested_names = result.right, ("q", "r")
+            leaf, leaf_name = result.left, "p"
+        assert isinstance(nested, node_cls)
+        assert isinstance(nested.left, Variable)
+        assert nested.left.name == nested_names[0]
+        assert isinstance(nested.right, Variable)
+        assert nested.right.name == nested_names[1]
+        assert isinstance(leaf, Variable)
+        assert leaf.name == leaf_name
+
+    @pytest.mark.parametrize("op,node_cls,method,inner_op,inner_cls", PRECEDENCE_CASES)
+    def test_parse_binary_with_tighter_operator(self, op, node_cls, method, inner_op, inner_cls):
+        parser = Parser(["p", inner_op, "q", op, "r"])
+        result = getattr(parser, method)()
+        assert isinstance(result, node_cls)
+        assert isinstance(result.left, inner_cls)
         assert isinstance(result.left.left, Variable)
         assert result.left.left.name == "p"
         assert isinstance(result.left.right, Variable)
         assert result.left.right.name == "q"
         assert isinstance(result.right, Variable)
         assert result.right.name == "r"
-    
+
+    @pytest.mark.parametrize("op,node_cls,method,assoc", BINARY_OPS)
+    def test_parse_binary_without_operator(self, op, node_cls, method, assoc):
+        parser = Parser(["p"])
+        result = getattr(parser, method)()
+        assert isinstance(result, Variable)
+        assert result.name == "p"
+
     def test_parse_and_with_negation(self):
         parser = Parser(["¬", "p", "∧", "q"])
         result = parser.parse_and()
@@ -146,129 +196,6 @@ class TestParser:
         assert result.left.operand.name == "p"
         assert isinstance(result.right, Variable)
         assert result.right.name == "q"
-    
-    def test_parse_and_without_and(self):
-        parser = Parser(["p"])
-        result = parser.parse_and()
-        assert isinstance(result, Variable)
-        assert result.name == "p"
-    
-    def test_parse_or_simple(self):
-        parser = Parser(["p", "∨", "q"])
-        result = parser.parse_or()
-        assert isinstance(result, Or)
-        assert isinstance(result.left, Variable)
-        assert result.left.name == "p"
-        assert isinstance(result.right, Variable)
-        assert result.right.name == "q"
-    
-    def test_parse_or_multiple(self):
-        parser = Parser(["p", "∨", "q", "∨", "r"])
-        result = parser.parse_or()
-        assert isinstance(result, Or)
-        assert isinstance(result.left, Or)
-        assert isinstance(result.left.left, Variable)
-        assert result.left.left.name == "p"
-        assert isinstance(result.left.right, Variable)
-        assert result.left.right.name == "q"
-        assert isinstance(result.right, Variable)
-        assert result.right.name == "r"
-    
-    def test_parse_or_with_and(self):
-        parser = Parser(["p", "∧", "q", "∨", "r"])
-        result = parser.parse_or()
-        assert isinstance(result, Or)
-        assert isinstance(result.left, And)
-        assert isinstance(result.left.left, Variable)
-        assert result.left.left.name == "p"
-        assert isinstance(result.left.right, Variable)
-        assert result.left.right.name == "q"
-        assert isinstance(result.right, Variable)
-        assert result.right.name == "r"
-    
-    def test_parse_or_without_or(self):
-        parser = Parser(["p"])
-        result = parser.parse_or()
-        assert isinstance(result, Variable)
-        assert result.name == "p"
-    
-    def test_parse_implication_simple(self):
-        parser = Parser(["p", "→", "q"])
-        result = parser.parse_implication()
-        assert isinstance(result, Implies)
-        assert isinstance(result.left, Variable)
-        assert result.left.name == "p"
-        assert isinstance(result.right, Variable)
-        assert result.right.name == "q"
-    
-    def test_parse_implication_right_associative(self):
-        parser = Parser(["p", "→", "q", "→", "r"])
-        result = parser.parse_implication()
-        assert isinstance(result, Implies)
-        assert isinstance(result.left, Variable)
-        assert result.left.name == "p"
-        assert isinstance(result.right, Implies)
-        assert isinstance(result.right.left, Variable)
-        assert result.right.left.name == "q"
-        assert isinstance(result.right.right, Variable)
-        assert result.right.right.name == "r"
-    
-    def test_parse_implication_with_or(self):
-        parser = Parser(["p", "∨", "q", "→", "r"])
-        result = parser.parse_implication()
-        assert isinstance(result, Implies)
-        assert isinstance(result.left, Or)
-        assert isinstance(result.left.left, Variable)
-        assert result.left.left.name == "p"
-        assert isinstance(result.left.right, Variable)
-        assert result.left.right.name == "q"
-        assert isinstance(result.right, Variable)
-        assert result.right.name == "r"
-    
-    def test_parse_implication_without_implies(self):
-        parser = Parser(["p"])
-        result = parser.parse_implication()
-        assert isinstance(result, Variable)
-        assert result.name == "p"
-    
-    def test_parse_biconditional_simple(self):
-        parser = Parser(["p", "↔", "q"])
-        result = parser.parse_biconditional()
-        assert isinstance(result, Biconditional)
-        assert isinstance(result.left, Variable)
-        assert result.left.name == "p"
-        assert isinstance(result.right, Variable)
-        assert result.right.name == "q"
-    
-    def test_parse_biconditional_multiple(self):
-        parser = Parser(["p", "↔", "q", "↔", "r"])
-        result = parser.parse_biconditional()
-        assert isinstance(result, Biconditional)
-        assert isinstance(result.left, Biconditional)
-        assert isinstance(result.left.left, Variable)
-        assert result.left.left.name == "p"
-        assert isinstance(result.left.right, Variable)
-        assert result.left.right.name == "q"
-        assert isinstance(result.right, Variable)
-        assert result.right.name == "r"
-    
-    def test_parse_biconditional_with_implication(self):
-        parser = Parser(["p", "→", "q", "↔", "r"])
-        result = parser.parse_biconditional()
-        assert isinstance(result, Biconditional)
-        assert isinstance(result.left, Implies)
-        assert isinstance(result.left.left, Variable)
-        assert result.left.left.name == "p"
-        assert isinstance(result.left.right, Variable)
-        assert result.left.right.name == "q"
-        assert isinstance(result.right, Variable)
-        assert result.right.name == "r"
-    
-    def test_parse_biconditional_without_biconditional(self):
-        parser = Parser(["p"])
-        result = parser.parse_biconditional()
-        assert isinstance(result, Variable)
-        assert result.name == "p"
 
 
 class TestParse:
@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.parser import tokenize, parse
+from src.logic_ast import Biconditional
+
+
+@pytest.mark.benchmark(group="parser", min_rounds=100)
+def test_tokenize_bench(benchmark):
+    tokens = benchmark(tokenize, "(p and q) -> (not r or s)")
+    assert tokens == ["(", "p", "and", "q", ")", "->", "(", "not", "r", "or", "s", ")"]
+
+
+@pytest.mark.benchmark(group="parser", min_rounds=100)
+def test_parse_complex_bench(benchmark):
+    result = benchmark(parse, "¬p ↔ (q ∨ r) → ¬s")
+    assert isinstance(result, Biconditional)
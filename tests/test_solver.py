@@ -2,7 +2,7 @@
 # pylint: disable=protected-access
 
 import pytest
-from src.solver import DPLLSolver, DecisionResult, Assignment, CDCLSolver, ImplicationNode
+from src.solver import DPLLSolver, DecisionResult, Assignment, CDCLSolver, ImplicationNode, solve_portfolio
 from src.logic_ast import CNFFormula, Clause, Literal
 
 
@@ -956,3 +956,28 @@ class TestCDCLSolver:
         
         result = solver._analyze_conflict(conflict_clause)
         assert len(result.literals) >= 1
+
+
+class TestPortfolio:
+    def test_seeded_solver_uses_random_phase(self):
+        cnf = CNFFormula([Clause([P, Q])])
+        solver = CDCLSolver(cnf, seed=0)
+        values = {solver._pick_branch_value("p") for _ in range(20)}
+        assert values == {True, False}
+
+    def test_unseeded_solver_defaults_to_true(self):
+        cnf = CNFFormula([Clause([P, Q])])
+        solver = CDCLSolver(cnf)
+        assert solver._pick_branch_value("p") is True
+
+    def test_solve_portfolio_sat(self):
+        cnf = CNFFormula([Clause([P, Q]), Clause([P_NEG, R]), Clause([Q_NEG, R_NEG])])
+        assert solve_portfolio(cnf, num_workers=2) == DecisionResult.SAT
+
+    def test_solve_portfolio_unsat(self):
+        cnf = CNFFormula([Clause([P]), Clause([P_NEG])])
+        assert solve_portfolio(cnf, num_workers=2) == DecisionResult.UNSAT
+
+    def test_solve_portfolio_single_worker(self):
+        cnf = CNFFormula([Clause([P])])
+        assert solve_portfolio(cnf, num_workers=1) == DecisionResult.SAT